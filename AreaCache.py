@@ -0,0 +1,89 @@
+import logging
+import time
+from collections import OrderedDict
+
+# Инициализация логгера для модуля AreaCache
+logger = logging.getLogger('area-manager.AreaCache')
+
+class AreaCache:
+    """LRU-кэш результатов find_depression_area_with_islands.
+
+    Ключ - (центр топика, шаг сетки, уровень воды, квантованный с шагом level_step).
+    Результат переиспользуется, пока уровень воды лежит в его диапазоне
+    (level_band_low, level_band_high]. Записи старше max_age_s удаляются.
+    """
+
+    def __init__(self, level_step=0.05, max_entries=64, max_age_s=24 * 3600):
+        self.level_step = level_step
+        self.max_entries = max_entries
+        self.max_age_s = max_age_s
+        # Записи в порядке последнего использования (LRU): ключ -> {'result', 'time'}
+        self.entries = OrderedDict()
+
+    def quantize_level(self, water_level):
+        """Номер шага, в который попадает уровень воды."""
+        return round(water_level / self.level_step)
+
+    def make_key(self, center_coords, distance, water_level):
+        lat, lon = center_coords
+        return (f"{lat:.6f},{lon:.6f}", distance, self.quantize_level(water_level))
+
+    def in_band(self, result, water_level):
+        """Проверяет, что при этом уровне воды область совпадает с сохраненной."""
+        return result['level_band_low'] < water_level <= result['level_band_high']
+
+    def evict_expired(self):
+        now = time.time()
+        expired = [key for key, entry in self.entries.items() if now - entry['time'] > self.max_age_s]
+        for key in expired:
+            del self.entries[key]
+        if expired:
+            logger.info(f"Evicted {len(expired)} expired area cache entries.")
+
+    def get(self, center_coords, distance, water_level):
+        """Возвращает сохраненный результат или None, если подходящей записи нет."""
+        self.evict_expired()
+        key = self.make_key(center_coords, distance, water_level)
+
+        # Сначала проверяем запись для того же шага уровня воды
+        entry = self.entries.get(key)
+        if entry is None or not self.in_band(entry['result'], water_level):
+            # Иначе ищем любую запись для этого центра и шага сетки, в диапазон которой попадает уровень
+            entry = None
+            for other_key, other_entry in self.entries.items():
+                if other_key[:2] == key[:2] and self.in_band(other_entry['result'], water_level):
+                    key, entry = other_key, other_entry
+                    break
+
+        if entry is None:
+            logger.info(f"Area cache miss for {key}.")
+            return None
+
+        self.entries.move_to_end(key)
+        logger.info(f"Area cache hit for {key} with water level {water_level}.")
+        return entry['result']
+
+    def put(self, center_coords, distance, water_level, result):
+        """Сохраняет результат."""
+        key = self.make_key(center_coords, distance, water_level)
+        self.entries[key] = {'result': result, 'time': time.time()}
+        self.entries.move_to_end(key)
+
+        # Вытесняем давно не использованные записи
+        while len(self.entries) > self.max_entries:
+            evicted_key, _ = self.entries.popitem(last=False)
+            logger.info(f"Evicted least recently used area cache entry {evicted_key}.")
+
+    def get_or_compute(self, analyzer, center_coords, distance, water_level):
+        """Берет результат из кэша или считает его через analyzer и сохраняет."""
+        result = self.get(center_coords, distance, water_level)
+        if result is not None:
+            return result
+
+        result = analyzer.find_depression_area_with_islands(center_coords, water_level, distance)
+        if result['lookup_failed']:
+            # Не кэшируем область, посчитанную с ошибочными высотами
+            logger.warning(f"Elevation lookup failed for {center_coords}. Area is not cached.")
+        else:
+            self.put(center_coords, distance, water_level, result)
+        return result
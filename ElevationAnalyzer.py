@@ -12,6 +12,8 @@ class ElevationAnalyzer:
 
     def __init__(self, delay_ms=1000):
         self.delay_ms = delay_ms
+        # Признак того, что хотя бы один запрос высоты завершился ошибкой
+        self.lookup_failed = False
 
     def get_elevation(self, coords, round_digits=6):
         # Округляем координаты
@@ -34,6 +36,7 @@ class ElevationAnalyzer:
 
                 if response.status_code == 504:
                     logger.warning(f"504 Error for coordinates {rounded_coords}. Skipping...")
+                    self.lookup_failed = True
                     return 0.0  # Пропускаем координаты с ошибкой
 
                 response.raise_for_status()  # Выбрасываем исключение, если статус ответа не 200
@@ -45,6 +48,7 @@ class ElevationAnalyzer:
                     return elevation
                 else:
                     logger.warning('No elevation data found for the given coordinates.')
+                    self.lookup_failed = True
                     return None
 
             except requests.exceptions.RequestException as e:
@@ -54,6 +58,7 @@ class ElevationAnalyzer:
                     time.sleep(5)  # Задержка перед повторной попыткой
                 else:
                     logger.error(f"Request failed after {max_attempts} attempts: {e}")
+                    self.lookup_failed = True
                     return None
 
     # async def get_elevation(coords, delay_ms=150):
@@ -98,6 +103,11 @@ class ElevationAnalyzer:
         included_points = set()
         islands = []
         island_id = 0
+        self.lookup_failed = False
+        # С initial_height сравнивается только центр, дальше точки сравниваются с высотой родителя.
+        # Поэтому область не меняется, пока уровень воды лежит в (level_band_low, level_band_high]:
+        # выше высоты центра, если центр затоплен, и не выше ее, если центр сухой
+        level_band = {'level_band_low': float('-inf'), 'level_band_high': float('inf')}
 
         def process_point(current_point, current_height):
             current_key = self.format_coords(current_point)
@@ -107,6 +117,12 @@ class ElevationAnalyzer:
 
             current_elevation = self.get_elevation(current_point, 8)
 
+            if current_key == self.format_coords(center_coords):
+                if current_elevation < current_height:
+                    level_band['level_band_low'] = current_elevation
+                else:
+                    level_band['level_band_high'] = current_elevation
+
             if current_elevation < current_height:
                 depression_points.add(current_key)
                 neighbors = self.get_neighbors(current_point)
@@ -157,11 +173,15 @@ class ElevationAnalyzer:
         logger.info("Perimeter Points: %s", [list(map(float, point.split(','))) for point in perimeter_points])
         logger.info("Included Points: %s", [list(map(float, point.split(','))) for point in included_points])
         logger.info("Islands: %s", islands)
+        logger.info("Level band: %s", level_band)
         return {
             'depression_points': [list(map(float, point.split(','))) for point in depression_points],
             'perimeter_points': [list(map(float, point.split(','))) for point in perimeter_points],
             'included_points': [list(map(float, point.split(','))) for point in included_points],
-            'islands': islands
+            'islands': islands,
+            'level_band_low': level_band['level_band_low'],
+            'level_band_high': level_band['level_band_high'],
+            'lookup_failed': self.lookup_failed
         }
 
     # async def find_depression_area_with_islands(self, center_coords, initial_height, distance=200):
@@ -7,6 +7,7 @@ import platform
 from logging.handlers import SysLogHandler
 from ElevationAnalyzer import ElevationAnalyzer
 from ma import MovingAverage
+from AreaCache import AreaCache
 
 DISTANCE = 200
 DELAY_MS = 300
@@ -16,6 +17,10 @@ SLOPE_FACTOR = 3
 
 ALPHA = 0.9
 
+AREA_CACHE_LEVEL_STEP = 0.05
+AREA_CACHE_MAX_ENTRIES = 64
+AREA_CACHE_MAX_AGE_S = 24 * 3600
+
 
 # Настройка корневого логгера
 root_logger = logging.getLogger()
@@ -106,9 +111,12 @@ def main():
     logger.info(f"Starting...")
     db_path = '../MQTT_Data_collector/mqtt_data.db'
     analyzer = ElevationAnalyzer(DELAY_MS)
+    area_cache = AreaCache(AREA_CACHE_LEVEL_STEP, AREA_CACHE_MAX_ENTRIES, AREA_CACHE_MAX_AGE_S)
 
     # Глобальный словарь для хранения времени последнего изменения данных для каждого топика
     last_data_change = {}
+    # Результат, который сейчас записан в AreaPoints для каждого топика
+    written_area_results = {}
 
     logger.info(f"All done!")
     while True:
@@ -151,8 +159,8 @@ def main():
                         center_coords = (latitude, longitude)
                         initial_height = p3  # Используем последнее предсказанное значение (p3)
 
-                        # Вычисляем точки
-                        result = analyzer.find_depression_area_with_islands(center_coords, initial_height, DISTANCE)
+                        # Вычисляем точки. Если уровень воды попадает в диапазон, где область не меняется, берем результат из кэша
+                        result = area_cache.get_or_compute(analyzer, center_coords, DISTANCE, initial_height)
 
                         # Открываем соединение для записи данных
                         with sqlite3.connect(db_path) as conn:
@@ -167,8 +175,21 @@ def main():
 
                             if not topic_exists:
                                 logger.warning(f"Topic {topic_id} does not exist in the database or was deleted. Skipping operations.")
+                                written_area_results.pop(topic_id, None)
                                 continue  # Прерываем выполнение, если топик не найден
 
+                            if written_area_results.get(topic_id) is result:
+                                # Область не изменилась, перезапись AreaPoints не требуется.
+                                # Считаем, что AreaPoints пишет только этот процесс: внешнее удаление или правка
+                                # не исправятся, пока запись кэша не устареет или условия топика не переключатся
+                                cursor.execute("""
+                                    UPDATE Topics SET CheckTime_Topic = ? WHERE ID_Topic = ?
+                                """, (datetime.now().timestamp(), topic_id))
+
+                                conn.commit()
+                                logger.info(f"Area for topic {topic_id} unchanged. CheckTime_Topic updated.")
+                                continue
+
                             # Удаляем старые данные для топика
                             cursor.execute("""
                                 DELETE FROM AreaPoints WHERE ID_Topic = ?
@@ -187,6 +208,7 @@ def main():
                             """, (datetime.now().timestamp(), topic_id))
 
                             conn.commit()
+                            written_area_results[topic_id] = result
                             logger.info(f"Data for topic {topic_id} inserted into AreaPoints and CheckTime_Topic updated.")
                     else:
                         # Если данные не прошли проверку по параметрам затопления, то топику не угрожает затопление. Очистка данных области затопления.
@@ -208,6 +230,7 @@ def main():
                             """, (datetime.now().timestamp(), topic_id))
 
                             conn.commit()
+                            written_area_results.pop(topic_id, None)
                             logger.info(f"Data for topic {topic_id} cleared from AreaPoints and CheckTime_Topic updated.")
                 else:
                     # Если новых данных нет, то расчет не требуется, но обновляем CheckTime_Topic, чтобы отметить, что топик был проверен
@@ -0,0 +1,88 @@
+import AreaCache as area_cache_module
+from AreaCache import AreaCache
+
+CENTER = (55.0, 37.0)
+
+
+def make_result(low, high, lookup_failed=False):
+    return {'level_band_low': low, 'level_band_high': high, 'lookup_failed': lookup_failed}
+
+
+class FakeAnalyzer:
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def find_depression_area_with_islands(self, center_coords, initial_height, distance=200):
+        self.calls += 1
+        return self.result
+
+
+def test_same_bucket_hit():
+    cache = AreaCache(level_step=0.05)
+    result = make_result(10.0, float('inf'))
+    cache.put(CENTER, 200, 12.0, result)
+
+    assert list(cache.entries) == [cache.make_key(CENTER, 200, 12.0)]
+    assert cache.get(CENTER, 200, 12.0) is result
+    assert cache.get(CENTER, 200, 12.01) is result
+
+
+def test_fallback_to_other_bucket_in_band():
+    cache = AreaCache(level_step=0.05)
+    result = make_result(10.0, float('inf'))
+    cache.put(CENTER, 200, 12.0, result)
+
+    assert cache.get(CENTER, 200, 50.0) is result
+
+
+def test_miss_outside_band_or_other_center():
+    cache = AreaCache(level_step=0.05)
+    cache.put(CENTER, 200, 12.0, make_result(10.0, float('inf')))
+
+    assert cache.get(CENTER, 200, 9.0) is None
+    assert cache.get((56.0, 37.0), 200, 12.0) is None
+    assert cache.get(CENTER, 100, 12.0) is None
+
+
+def test_expired_entries_are_evicted(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(area_cache_module.time, 'time', lambda: now[0])
+    cache = AreaCache(max_age_s=60)
+    cache.put(CENTER, 200, 12.0, make_result(10.0, float('inf')))
+
+    now[0] += 30
+    assert cache.get(CENTER, 200, 12.0) is not None
+    now[0] += 31
+    assert cache.get(CENTER, 200, 12.0) is None
+    assert not cache.entries
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = AreaCache(max_entries=2)
+    for center in ((1.0, 1.0), (2.0, 2.0)):
+        cache.put(center, 200, 12.0, make_result(10.0, float('inf')))
+    cache.get((1.0, 1.0), 200, 12.0)
+    cache.put((3.0, 3.0), 200, 12.0, make_result(10.0, float('inf')))
+
+    assert list(cache.entries) == [cache.make_key((1.0, 1.0), 200, 12.0), cache.make_key((3.0, 3.0), 200, 12.0)]
+
+
+def test_get_or_compute_reuses_cached_result():
+    cache = AreaCache()
+    analyzer = FakeAnalyzer(make_result(10.0, float('inf')))
+
+    result = cache.get_or_compute(analyzer, CENTER, 200, 12.0)
+    assert cache.get_or_compute(analyzer, CENTER, 200, 12.01) is result
+    assert analyzer.calls == 1
+
+
+def test_get_or_compute_does_not_cache_failed_lookup():
+    cache = AreaCache()
+    analyzer = FakeAnalyzer(make_result(10.0, float('inf'), lookup_failed=True))
+
+    cache.get_or_compute(analyzer, CENTER, 200, 12.0)
+    cache.get_or_compute(analyzer, CENTER, 200, 12.0)
+    assert not cache.entries
+    assert analyzer.calls == 2
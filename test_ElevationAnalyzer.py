@@ -0,0 +1,136 @@
+import math
+
+import requests
+
+import ElevationAnalyzer as elevation_analyzer_module
+from AreaCache import AreaCache
+from ElevationAnalyzer import ElevationAnalyzer
+
+CENTER = (55.0, 37.0)
+
+
+class FakeResponse:
+
+    def __init__(self, status_code=200, data=None):
+        self.status_code = status_code
+        self.data = data
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error")
+
+    def json(self):
+        return self.data
+
+
+def fail_with_504(monkeypatch):
+    monkeypatch.setattr(elevation_analyzer_module.requests, 'get', lambda *args, **kwargs: FakeResponse(504))
+
+
+def make_bowl_analyzer(failing_points=()):
+    # Центр 10, первое кольцо 5, дальше 7. Высоты точек из failing_points запрашиваются реальным get_elevation
+    analyzer = ElevationAnalyzer(0)
+    failing_keys = {analyzer.format_coords(point) for point in failing_points}
+
+    def get_elevation(coords, round_digits=6):
+        if analyzer.format_coords(coords) in failing_keys:
+            return ElevationAnalyzer.get_elevation(analyzer, coords, round_digits)
+        ring = max(abs(round((coords[0] - CENTER[0]) * 111320 / 200)),
+                   abs(round((coords[1] - CENTER[1]) * 111320 * math.cos(math.radians(CENTER[0])) / 200)))
+        return {0: 10.0, 1: 5.0}.get(ring, 7.0)
+
+    analyzer.get_elevation = get_elevation
+    return analyzer
+
+
+def test_bowl_rings():
+    analyzer = make_bowl_analyzer()
+
+    assert analyzer.get_elevation(CENTER) == 10.0
+    assert [analyzer.get_elevation(neighbor) for neighbor in analyzer.get_neighbors(CENTER)] == [5.0] * 8
+
+
+def test_504_sets_lookup_failed(monkeypatch):
+    fail_with_504(monkeypatch)
+    analyzer = ElevationAnalyzer(0)
+
+    assert analyzer.get_elevation(CENTER) == 0.0
+    assert analyzer.lookup_failed
+
+
+def test_missing_elevation_sets_lookup_failed(monkeypatch):
+    monkeypatch.setattr(elevation_analyzer_module.requests, 'get',
+                        lambda *args, **kwargs: FakeResponse(200, {'results': []}))
+    analyzer = ElevationAnalyzer(0)
+
+    assert analyzer.get_elevation(CENTER) is None
+    assert analyzer.lookup_failed
+
+
+def test_exhausted_retries_set_lookup_failed(monkeypatch):
+    def get(*args, **kwargs):
+        raise requests.exceptions.ConnectionError("connection refused")
+
+    monkeypatch.setattr(elevation_analyzer_module.requests, 'get', get)
+    monkeypatch.setattr(elevation_analyzer_module.time, 'sleep', lambda seconds: None)
+    analyzer = ElevationAnalyzer(0)
+
+    assert analyzer.get_elevation(CENTER) is None
+    assert analyzer.lookup_failed
+
+
+def test_successful_lookup_does_not_set_lookup_failed(monkeypatch):
+    monkeypatch.setattr(elevation_analyzer_module.requests, 'get',
+                        lambda *args, **kwargs: FakeResponse(200, {'results': [{'elevation': 42.0}]}))
+    analyzer = ElevationAnalyzer(0)
+
+    assert analyzer.get_elevation(CENTER) == 42.0
+    assert not analyzer.lookup_failed
+
+
+def test_band_contains_computed_level_when_center_floods():
+    result = make_bowl_analyzer().find_depression_area_with_islands(CENTER, 12.0)
+
+    assert len(result['depression_points']) == 9
+    assert result['level_band_low'] < 12.0 <= result['level_band_high']
+    assert (result['level_band_low'], result['level_band_high']) == (10.0, float('inf'))
+    assert not result['lookup_failed']
+
+
+def test_band_contains_computed_level_when_center_is_dry():
+    result = make_bowl_analyzer().find_depression_area_with_islands(CENTER, 8.0)
+
+    assert result['depression_points'] == []
+    assert (result['level_band_low'], result['level_band_high']) == (float('-inf'), 10.0)
+
+
+def test_cached_result_is_reused_at_same_and_nearby_levels():
+    analyzer = make_bowl_analyzer()
+    cache = AreaCache(level_step=0.05)
+    result = analyzer.find_depression_area_with_islands(CENTER, 12.0)
+    cache.put(CENTER, 200, 12.0, result)
+
+    for level in (12.0, 12.01, 50.0):
+        assert analyzer.find_depression_area_with_islands(CENTER, level)['depression_points'] == result['depression_points']
+        assert cache.get(CENTER, 200, level) is result
+
+
+def test_lookup_failed_is_reset_between_calls(monkeypatch):
+    fail_with_504(monkeypatch)
+    failing_point = (CENTER[0] + 200 / 111320, CENTER[1])
+    analyzer = make_bowl_analyzer([failing_point])
+
+    assert analyzer.find_depression_area_with_islands(CENTER, 12.0)['lookup_failed']
+    # Та же точка на уровне ниже центра не запрашивается, значит ошибок нет
+    assert not analyzer.find_depression_area_with_islands(CENTER, 8.0)['lookup_failed']
+
+
+def test_area_with_failed_lookup_is_not_cached(monkeypatch):
+    fail_with_504(monkeypatch)
+    failing_point = (CENTER[0] + 200 / 111320, CENTER[1])
+    analyzer = make_bowl_analyzer([failing_point])
+    cache = AreaCache()
+
+    result = cache.get_or_compute(analyzer, CENTER, 200, 12.0)
+    assert result['lookup_failed']
+    assert not cache.entries